@@ -16,7 +16,6 @@
 #
 # ============================================================
 
-import copy
 import sys
 from enum import IntEnum
 
@@ -35,6 +34,128 @@ class CompressionLevel(IntEnum):
     SIGIL_ONLY = 3   # Anchor only; reconstruction required
 
 
+# ============================================================
+# LOOP 1.4 — PRE-INTERNED VOCABULARY
+# ============================================================
+# Roles and fixed markers form a small closed vocabulary, so
+# they are interned once at import instead of on every node.
+# ============================================================
+
+_ROLE_CACHE = {
+    r: sys.intern(r) for r in ("user", "ai", "system", "guardian", "unknown")
+}
+_UNKNOWN_ROLE = _ROLE_CACHE["unknown"]
+_BLOCKED = sys.intern("[Blocked]")
+
+# Fixed fragments of the auto-seed format: "[AutoSeed AC-<cycle>]: <snippet>..."
+_SEED_PREFIX = sys.intern("[AutoSeed AC-")
+_SEED_MID = sys.intern("]: ")
+_SEED_SUFFIX = sys.intern("...")
+
+
+# Guardian-blocked nodes share one shape; only identity and
+# error fields vary, so they are filled from this template.
+_BLOCKED_TEMPLATE = {
+    "role": _UNKNOWN_ROLE,
+    "cycle": 0,
+    "error": "",
+    "seed": _BLOCKED,
+    "compression_level": CompressionLevel.SIGIL_ONLY,
+    "compressed_from": None,
+    "children": None,
+}
+
+
+def _intern_role(role: str) -> str:
+    return _ROLE_CACHE.get(role, role)
+
+
+def _blocked_marker(node, reason) -> dict:
+    """Builds the Guardian-blocked replacement for a node."""
+    blocked = _BLOCKED_TEMPLATE.copy()
+    blocked["role"] = _intern_role(node.get("role", _UNKNOWN_ROLE))
+    blocked["cycle"] = node.get("cycle", 0)
+    # Fixed markers are pre-interned; the error text varies per
+    # reason, so interning it would only grow the intern table
+    blocked["error"] = f"[Guardian] Collapse blocked: {reason}"
+    blocked["compressed_from"] = node.get("compression_level", CompressionLevel.RAW)
+    # Never share the template's children list between nodes
+    blocked["children"] = []
+    return blocked
+
+
+def _is_settled(node) -> bool:
+    """
+    True for a leaf that collapse would leave unchanged: already at
+    SEED or beyond, seeded, with content None, compressed_from set
+    and an empty children list. The walk validates such leaves but
+    does not rewrite them.
+    """
+    children = node.get("children")
+    return (
+        node.get("compression_level", CompressionLevel.RAW) >= CompressionLevel.SEED
+        and "content" in node
+        and node["content"] is None
+        and "compressed_from" in node
+        and type(children) is list
+        and not children
+        and bool(node.get("seed"))
+    )
+
+
+def _shallow_clone(node: dict) -> dict:
+    """
+    Copies a single node level, leaving out its children.
+    Children are rebuilt by the collapse walk, so deep-copying
+    them here would only be thrown away.
+    """
+    return {k: node[k] for k in node if k != "children"}
+
+
+def _clone_tree(node: dict) -> dict:
+    """
+    Copies every node level of a tree, giving each clone a fresh
+    children list. Field values themselves are shared, not copied.
+    """
+    root = _shallow_clone(node)
+    stack = [(node, root)]
+
+    while stack:
+        source, clone = stack.pop()
+        children = []
+        for child in source.get("children", ()):
+            child_clone = _shallow_clone(child)
+            children.append(child_clone)
+            stack.append((child, child_clone))
+        clone["children"] = children
+
+    return root
+
+
+def _bulk_generate_seeds(nodes_needing_seed: list):
+    """
+    Generates auto-seeds for a batch of collapsed nodes in one pass.
+
+    Fields are pulled out into parallel lists first, so snippet
+    length and seed text are computed by flat comprehensions
+    instead of per-node branches inside the tree walk.
+    """
+    raws = [n.get("content", "") for n in nodes_needing_seed]
+    priorities = [n.get("priority", 0) for n in nodes_needing_seed]
+    cycles = [n.get("cycle", 0) for n in nodes_needing_seed]
+
+    # High priority keeps a longer snippet; low priority truncates aggressively
+    cuts = [80 if p >= 3 else 50 for p in priorities]
+    seeds = [
+        "".join((_SEED_PREFIX, str(c), _SEED_MID, r[:k], _SEED_SUFFIX))
+        for c, r, k in zip(cycles, raws, cuts)
+    ]
+
+    for n, seed in zip(nodes_needing_seed, seeds):
+        n["seed"] = seed
+        n["content"] = None
+
+
 class ACCollapseEngine:
     """
     Safe collapse engine bound to Guardian policy rules.
@@ -50,6 +171,10 @@ class ACCollapseEngine:
         # Optional binding; ArcMemorySystem will inject Guardian instance
         self.guardian = guardian
 
+        # Guardian verdicts memoized for the duration of one collapse
+        # walk, keyed by (role, cycle, child_count, depth)
+        self._gate_cache = {}
+
     # ------------------------------------------------------------
     #  INTERNAL: validate structure before collapse
     # ------------------------------------------------------------
@@ -63,19 +188,23 @@ class ACCollapseEngine:
         if self.guardian is None:
             return True, None
 
-        # Loop 1.4 Optimization: Intern high-frequency strings
-        role = sys.intern(node.get("role", "unknown"))
+        # Loop 1.4 Optimization: Reuse pre-interned role strings
+        role = _intern_role(node.get("role", _UNKNOWN_ROLE))
         cycle = node.get("cycle", 0)
-        children = node.get("children", [])
+        child_count = len(node.get("children", []))
 
-        ok, reason = self.guardian.gate(
-            role=role,
-            cycle=cycle,
-            child_count=len(children),
-            depth=depth,
-        )
+        key = (role, cycle, child_count, depth)
+        verdict = self._gate_cache.get(key)
+        if verdict is None:
+            verdict = self.guardian.gate(
+                role=role,
+                cycle=cycle,
+                child_count=child_count,
+                depth=depth,
+            )
+            self._gate_cache[key] = verdict
 
-        return ok, reason
+        return verdict
 
     # ------------------------------------------------------------
     #  MAIN COLLAPSE
@@ -83,67 +212,97 @@ class ACCollapseEngine:
 
     def collapse_state(self, node: dict, depth: int = 0) -> dict:
         """
-        Recursively collapses a node into a seed-safe structure.
+        Collapses a node tree into a seed-safe structure.
         All Guardian policies are enforced at each step.
+        The caller's tree is preserved; collapse runs on a clone.
+        """
+        return self.collapse_state_inplace(_clone_tree(node), depth)
+
+    def collapse_state_inplace(self, node: dict, depth: int = 0) -> dict:
+        """
+        Collapses a node tree by mutating it directly, reusing its
+        dicts and children lists. Returns the same root node.
+        For callers that do not need the original tree.
+
+        The tree is walked with an explicit stack rather than
+        recursion, so depth is bounded by the heap and not by
+        the Python call stack.
+
+        Leaves that are already
+        collapsed are validated but otherwise left untouched, so a
+        previous result can be collapsed again cheaply.
         """
 
-        # 1. Structural clone (Preserve original memory safe)
-        collapsed = copy.deepcopy(node)
+        # Nodes without a seed are gathered and seeded in one batch
+        pending = []
+
+        try:
+            ok = self._collapse_node(node, depth, pending)
+            stack = [(node, depth)] if ok else []
+
+            while stack:
+                current, level = stack.pop()
+                children = current["children"]
+
+                for index, child in enumerate(children):
+                    if _is_settled(child):
+                        # Already collapsed; only Guardian is consulted,
+                        # and the leaf itself is never mutated
+                        ok, reason = self._validate_node(child, level + 1)
+                        if not ok:
+                            children[index] = _blocked_marker(child, reason)
+                        continue
+
+                    ok = self._collapse_node(child, level + 1, pending)
+                    if ok and child["children"]:
+                        stack.append((child, level + 1))
+        finally:
+            # Guardian policy may change between walks
+            self._gate_cache.clear()
+
+        _bulk_generate_seeds(pending)
+
+        return node
+
+    def _collapse_node(self, node: dict, depth: int, pending: list) -> bool:
+        """
+        Collapses a single node in place, leaving its children list
+        for the walk. Returns True if the walk should descend into
+        the children, or False if Guardian refused the node, in which
+        case it is rewritten as a blocked marker with no children.
+
+        Nodes that still need a seed are appended to `pending`
+        with their content intact; the walk seeds them later.
+        """
 
         # Ensure compression metadata exists
-        collapsed.setdefault("compression_level", CompressionLevel.RAW)
-        collapsed.setdefault("compressed_from", None)
+        node.setdefault("compression_level", CompressionLevel.RAW)
+        node.setdefault("compressed_from", None)
+        node.setdefault("children", [])
 
-        # 2. Guardian validation (Optimized)
-        ok, reason = self._validate_node(collapsed, depth)
+        # 1. Guardian validation (Optimized)
+        ok, reason = self._validate_node(node, depth)
         if not ok:
-            # Intern error states for memory efficiency on failures
-            return {
-                "role": sys.intern(collapsed.get("role", "unknown")),
-                "cycle": collapsed.get("cycle", 0),
-                "error": sys.intern(f"[Guardian] Collapse blocked: {reason}"),
-                "seed": sys.intern("[Blocked]"),
-                "compression_level": CompressionLevel.SIGIL_ONLY,
-                "compressed_from": collapsed.get("compression_level"),
-                "children": []
-            }
-
-        # 3. Priority-sensitive collapse (The "Prismatic" Step)
-        seed = collapsed.get("seed")
-        raw = collapsed.get("content", "")
-        priority = collapsed.get("priority", 0)
+            blocked = _blocked_marker(node, reason)
+            node.clear()
+            node.update(blocked)
+            return False
+
+        # 2. Priority-sensitive collapse (The "Prismatic" Step)
+        seed = node.get("seed")
 
         # Strategy: If seed exists, safely discard raw content
         if seed:
-            collapsed["content"] = None
+            node["content"] = None
             # Explicit State Transition
-            if collapsed["compression_level"] == CompressionLevel.RAW:
-                collapsed["compressed_from"] = CompressionLevel.RAW
-                collapsed["compression_level"] = CompressionLevel.SEED
+            if node["compression_level"] == CompressionLevel.RAW:
+                node["compressed_from"] = CompressionLevel.RAW
+                node["compression_level"] = CompressionLevel.SEED
 
         else:
-            # Strategy: Generate seed if missing
-            if priority >= 3:
-                # High priority: Keep longer snippet
-                snippet = raw[:80]
-            else:
-                # Low priority: Aggressive truncate
-                snippet = raw[:50]
-
-            # Loop 1.4: Intern the prefix logic if possible, though variable content cannot be interned.
-            collapsed["seed"] = f"[AutoSeed AC-{collapsed.get('cycle', 0)}]: {snippet}..."
-            collapsed["content"] = None
-            collapsed["compressed_from"] = collapsed.get("compression_level")
-            collapsed["compression_level"] = CompressionLevel.SEED
-
-        # 4. Recursively collapse children
-        child_list = collapsed.get("children", [])
-        new_children = []
-
-        for child in child_list:
-            new_child = self.collapse_state(child, depth + 1)
-            new_children.append(new_child)
-
-        collapsed["children"] = new_children
-
-        return collapsed
+            # Strategy: Generate seed if missing (batched, see _bulk_generate_seeds)
+            pending.append(node)
+            node["compressed_from"] = node.get("compression_level")
+            node["compression_level"] = CompressionLevel.SEED
+
+        return True
@@ -1,16 +1,32 @@
 # ac_echo.py
 # ArcEcho: Signal tracing, loop reflection, memory reverb handler
 
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
 import hashlib
+import time
+
+
+def _iso_utc(ts_ns: int) -> str:
+    """Formats a time.time_ns() stamp as an ISO-8601 UTC string."""
+    seconds, nanos = divmod(ts_ns, 1_000_000_000)
+    stamp = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return stamp.replace(microsecond=nanos // 1_000).isoformat()
+
 
 class ArcEcho:
-    def __init__(self):
-        self.echo_log = []
+    # Oldest echoes are evicted once the log reaches this size
+    MAX_ECHOES = 10_000
+
+    def __init__(self, max_echoes: int = MAX_ECHOES):
+        self.echo_log = deque(maxlen=max_echoes)
 
     def pulse(self, signal: str, source: str = "manual", intensity: int = 1):
-        timestamp = datetime.utcnow().isoformat()
-        echo_id = hashlib.sha256(f"{signal}{timestamp}".encode()).hexdigest()[:12]
+        # Raw nanosecond stamp; ISO formatting is deferred to export()
+        timestamp = time.time_ns()
+        # Ids are correlation tags, so a 6-byte BLAKE2b digest (12 hex chars) is enough
+        echo_id = hashlib.blake2b(f"{signal}{timestamp}".encode(), digest_size=6).hexdigest()
         echo_entry = {
             "id": echo_id,
             "signal": signal,
@@ -22,15 +38,22 @@ class ArcEcho:
         return echo_entry
 
     def reflect(self, count=5):
-        return self.echo_log[-count:]
+        if count <= 0:
+            # Preserve list-slice semantics for non-positive counts
+            return list(self.echo_log)[-count:]
+        start = max(len(self.echo_log) - count, 0)
+        return list(islice(self.echo_log, start, None))
 
     def clear(self):
-        self.echo_log = []
+        self.echo_log.clear()
 
     def export(self):
         return {
             "echo_count": len(self.echo_log),
-            "echoes": self.echo_log,
+            "echoes": [
+                {**e, "timestamp": _iso_utc(e["timestamp"])}
+                for e in self.echo_log
+            ],
         }
 
 # Optional: test run
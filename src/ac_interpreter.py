@@ -9,16 +9,20 @@ def cmd_reconstruct_full(self, args: str):
 
 def cmd_reconstruct_thread(self, args: str):
     """Reconstruct only the nodes belonging to a specific cycle."""
-    if not args.strip():
+    cycle_arg = args.strip()
+    if not cycle_arg:
         return "[thread] Usage: ac thread <cycle>"
     try:
-        cycle_id = int(args.strip())
-        tree = self.memory.root.to_dict()
-        lines = self.reconstruct.reconstruct_thread(tree, cycle_id)
-        return "\n".join(lines) if lines else "[thread] No entries found."
-    except:
+        cycle_id = int(cycle_arg)
+    except ValueError:
         return "[thread] Invalid cycle ID."
 
+    # Only matched nodes are serialized; same nodes, same order
+    lines = []
+    for node in self.memory.iter_cycle(cycle_id):
+        self.reconstruct.reconstruct_node(node.to_dict(), 0, lines)
+    return "\n".join(lines) if lines else "[thread] No entries found."
+
 def cmd_summary(self, args: str):
     """
     High-level reconstruction summary.
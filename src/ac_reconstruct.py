@@ -5,10 +5,18 @@
 # Guardian: Arien
 # ============================================================
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ac_collapse import CompressionLevel
 
 
+# Indent strings for typical tree depths, built once at import
+_INDENTS = tuple("  " * i for i in range(256))
+
+
+def _indent(depth: int) -> str:
+    return _INDENTS[depth] if depth < 256 else "  " * depth
+
+
 class ArcReconstruct:
     """
     Deterministic reconstruction engine for ArcCore-Prime.
@@ -21,6 +29,30 @@ class ArcReconstruct:
       - Respect compression fidelity (Loop 2.2)
     """
 
+    def __init__(self):
+        # Recycled traversal stacks; reconstruction is called per
+        # command, so a stack is reused instead of reallocated
+        self._scratch_pool: List[list] = []
+
+        # Compression-level dispatch table (Loop 2.2)
+        self._handlers = {
+            CompressionLevel.RAW: self._rebuild_struct,
+            CompressionLevel.SUMMARY: self._rebuild_struct,
+            CompressionLevel.SEED: self._rebuild_seed,
+            CompressionLevel.SIGIL_ONLY: self._rebuild_sigil,
+        }
+
+    # ------------------------------------------------------------
+    # SCRATCH POOL (transient traversal state)
+    # ------------------------------------------------------------
+
+    def _take(self) -> list:
+        return self._scratch_pool.pop() if self._scratch_pool else []
+
+    def _give(self, scratch: list):
+        scratch.clear()
+        self._scratch_pool.append(scratch)
+
     # ------------------------------------------------------------
     # SEED EXPANSION (deterministic)
     # ------------------------------------------------------------
@@ -34,40 +66,70 @@ class ArcReconstruct:
         if seed is None:
             return "(no seed)"
 
-        if seed.startswith("[AC-"):
-            cycle_tag = seed.split("]")[0][1:]
-            body = seed.split("] ", 1)[-1]
-            return f"({cycle_tag}) → {body}"
+        # One scan splits the cycle tag from the body
+        head, _, rest = seed.partition("]")
 
-        if seed.startswith("[Seed AC-"):
-            cycle_tag = seed.split("]")[0][1:]
-            body = seed.split("]: ", 1)[-1]
-            return f"({cycle_tag}) → {body}"
+        if head.startswith("[AC-"):
+            separator = "] "
+        elif head.startswith("[Seed AC-"):
+            separator = "]: "
+        else:
+            return f"(expanded) {seed}"
 
-        return f"(expanded) {seed}"
+        cycle_tag = head[1:]
+        if rest.startswith(separator[1:]):
+            body = rest[len(separator) - 1:]
+        else:
+            # Irregular seed; the separator is not at the first "]"
+            body = seed.split(separator, 1)[-1]
+        return f"({cycle_tag}) → {body}"
 
     # ------------------------------------------------------------
     # PATH-BASED RECONSTRUCTION (RAW / SUMMARY)
     # ------------------------------------------------------------
 
-    def reconstruct_path(self, node: Dict[str, Any], depth: int = 0) -> List[str]:
+    def reconstruct_path(
+        self,
+        node: Dict[str, Any],
+        depth: int = 0,
+        out: Optional[List[str]] = None,
+    ) -> List[str]:
         """
         Reconstructs a node and its children structurally.
         Used for RAW and SUMMARY compression levels.
+
+        Structural descendants are walked with an explicit stack;
+        other descendants are dispatched through reconstruct_node.
+        Lines are appended to `out` (a fresh list if omitted),
+        which is returned.
         """
-        output = []
-        indent = "  " * depth
+        output = [] if out is None else out
+        stack = self._take()
+        stack.append((node, depth, True))
 
-        seed = node.get("seed") or node.get("content")
-        expanded = self.expand_seed(seed)
-        cycle = node.get("cycle")
-        role = node.get("role", "").upper()
+        while stack:
+            current, level, structural = stack.pop()
+
+            if not structural:
+                self.reconstruct_node(current, level, output)
+                continue
+
+            indent = _indent(level)
 
-        output.append(f"{indent}[AC-{cycle}] {role}: {expanded}")
+            seed = current.get("seed") or current.get("content")
+            expanded = self.expand_seed(seed)
+            cycle = current.get("cycle")
+            role = current.get("role", "").upper()
 
-        for child in node.get("children", []):
-            output.extend(self.reconstruct_node(child, depth + 1))
+            output.append(f"{indent}[AC-{cycle}] {role}: {expanded}")
 
+            # Reversed so children pop off the stack in their original order
+            for child in reversed(current.get("children", [])):
+                child_level = child.get("compression_level", CompressionLevel.RAW)
+                is_structural = child_level in (CompressionLevel.RAW, CompressionLevel.SUMMARY)
+                stack.append((child, level + 1, is_structural))
+
+        self._give(stack)
         return output
 
     # ------------------------------------------------------------
@@ -78,52 +140,83 @@ class ArcReconstruct:
         """
         Returns all nodes belonging to a given cycle, expanded.
         Compression level is respected per node.
+
+        Subtrees annotated with "cycle_min" / "cycle_max" bounds
+        that exclude cycle_id are skipped without being walked.
         """
         results = []
+        stack = self._take()
+        stack.append(tree)
+
+        while stack:
+            n = stack.pop()
+
+            cycle_min = n.get("cycle_min")
+            cycle_max = n.get("cycle_max")
+            if (cycle_max is not None and cycle_max < cycle_id) or (
+                cycle_min is not None and cycle_min > cycle_id
+            ):
+                continue
 
-        def walk(n: Dict[str, Any]):
             if int(n.get("cycle", -1)) == cycle_id:
-                results.extend(self.reconstruct_node(n))
+                self.reconstruct_node(n, 0, results)
 
-            for child in n.get("children", []):
-                walk(child)
+            stack.extend(reversed(n.get("children", [])))
 
-        walk(tree)
+        self._give(stack)
         return results
 
     # ------------------------------------------------------------
     # COMPRESSION-AWARE DISPATCH (Loop 2.2)
     # ------------------------------------------------------------
 
-    def reconstruct_node(self, node: Dict[str, Any], depth: int = 0) -> List[str]:
+    def reconstruct_node(
+        self,
+        node: Dict[str, Any],
+        depth: int = 0,
+        out: Optional[List[str]] = None,
+    ) -> List[str]:
         """
         Dispatch reconstruction based on compression level.
         Reconstruction is meaning-first and fidelity-honest.
+        Lines are appended to `out` (a fresh list if omitted),
+        which is returned.
         """
+        if out is None:
+            out = []
 
         level = node.get("compression_level", CompressionLevel.RAW)
-        indent = "  " * depth
-        role = node.get("role", "").upper()
-        cycle = node.get("cycle")
-
-        # RAW and SUMMARY — full structural traversal
-        if level in (CompressionLevel.RAW, CompressionLevel.SUMMARY):
-            return self.reconstruct_path(node, depth)
+        handler = self._handlers.get(level, self._rebuild_fallback)
+        return handler(node, depth, out)
 
-        # SEED — expand auric seed only
-        if level == CompressionLevel.SEED:
-            expanded = self.expand_seed(node.get("seed"))
-            return [f"{indent}[AC-{cycle}] {role}: {expanded}"]
+    # RAW and SUMMARY — full structural traversal
+    def _rebuild_struct(self, node: Dict[str, Any], depth: int, out: List[str]) -> List[str]:
+        return self.reconstruct_path(node, depth, out)
 
-        # SIGIL_ONLY — honest boundary
-        if level == CompressionLevel.SIGIL_ONLY:
-            return [
-                f"{indent}[AC-{cycle}] {role}: "
-                "[Sigil Anchor — reconstruction required]"
-            ]
+    # SEED — expand auric seed only
+    def _rebuild_seed(self, node: Dict[str, Any], depth: int, out: List[str]) -> List[str]:
+        role = node.get("role", "").upper()
+        expanded = self.expand_seed(node.get("seed"))
+        out.append(f"{_indent(depth)}[AC-{node.get('cycle')}] {role}: {expanded}")
+        return out
 
-        # Defensive fallback
-        return [f"{indent}[AC-{cycle}] {role}: [Unknown compression state]"]
+    # SIGIL_ONLY — honest boundary
+    def _rebuild_sigil(self, node: Dict[str, Any], depth: int, out: List[str]) -> List[str]:
+        role = node.get("role", "").upper()
+        out.append(
+            f"{_indent(depth)}[AC-{node.get('cycle')}] {role}: "
+            "[Sigil Anchor — reconstruction required]"
+        )
+        return out
+
+    # Defensive fallback
+    def _rebuild_fallback(self, node: Dict[str, Any], depth: int, out: List[str]) -> List[str]:
+        role = node.get("role", "").upper()
+        out.append(
+            f"{_indent(depth)}[AC-{node.get('cycle')}] {role}: "
+            "[Unknown compression state]"
+        )
+        return out
 
     # ------------------------------------------------------------
     # FULL TREE RECONSTRUCTION (pretty print)
@@ -134,5 +227,6 @@ class ArcReconstruct:
         Reconstructs the entire tree into a human-readable
         structural summary, respecting compression levels.
         """
-        lines = self.reconstruct_node(tree)
-        return "\n".join(lines)
+        out = []
+        self.reconstruct_node(tree, 0, out)
+        return "\n".join(out)
@@ -34,7 +34,22 @@ class Colors:
     SIGIL_MID = '✨'
     SIGIL_LOW = '•'
 
+# ============================================================
+# BOOT BANNER (built once at import; shared by all consoles)
+# ============================================================
+_BOOT_BANNER = f"""
+{Colors.BLUE}    ___  ___  ___  {Colors.BOLD}___  ____  ___  ______{Colors.ENDC}
+{Colors.BLUE}   / _ |/ _ \/ __|{Colors.BOLD}/ _ \/ __ \/ _ \/ __/_{Colors.ENDC}
+{Colors.BLUE}  / __ / , _/ /__ {Colors.BOLD}/ // / /_/ / , _/ _/  {Colors.ENDC}
+{Colors.BLUE} /_/ |_\_/|_\___/{Colors.BOLD}\___/\____/_/|_/___/  {Colors.ENDC}
+        """
+_BOOT_SEPARATOR = "\n" + "=" * 60 + "\n"
+
 class ArcConsole:
+    # Inputs that end the session (checked before purification)
+    _EXIT_COMMANDS = frozenset(("exit", "quit", "shutdown"))
+    _EXIT_MAX_LEN = max(map(len, _EXIT_COMMANDS))
+
     def __init__(self):
         self.guardian = ArcGuardian()
         self.interpreter = ArcInterpreter(self.guardian)
@@ -48,17 +63,21 @@ class ArcConsole:
             sys.stdout.flush()
             time.sleep(speed)
         sys.stdout.write(Colors.ENDC + "\n")
+        sys.stdout.flush()
+
+    def emit(self, *lines):
+        """
+        Writes output lines in one call and flushes once.
+        stdout is block-buffered while the console runs, so
+        each command costs a single write.
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def boot_sequence(self):
         os.system('cls' if os.name == 'nt' else 'clear')
         
-        banner = f"""
-{Colors.BLUE}    ___  ___  ___  {Colors.BOLD}___  ____  ___  ______{Colors.ENDC}
-{Colors.BLUE}   / _ |/ _ \/ __|{Colors.BOLD}/ _ \/ __ \/ _ \/ __/_{Colors.ENDC}
-{Colors.BLUE}  / __ / , _/ /__ {Colors.BOLD}/ // / /_/ / , _/ _/  {Colors.ENDC}
-{Colors.BLUE} /_/ |_\_/|_\___/{Colors.BOLD}\___/\____/_/|_/___/  {Colors.ENDC}
-        """
-        print(banner)
+        self.emit(_BOOT_BANNER)
         time.sleep(0.5)
         
         self.type_effect(f"[KERNEL] Initializing ArcCore-Prime...", color=Colors.GREEN)
@@ -73,24 +92,65 @@ class ArcConsole:
         else:
              self.type_effect(f"[SYSTEM]  Integrity WARNING.", color=Colors.FAIL)
              
-        print("\n" + "="*60 + "\n")
+        self.emit(_BOOT_SEPARATOR)
+
+    def read_line(self, prompt):
+        """
+        Reads one command line. Interactive terminals keep input()
+        for line editing and history; piped or pasted input is read
+        through sys.stdin's buffered reader in whole chunks.
+        Returns None at end of input.
+        """
+        if sys.stdin.isatty():
+            try:
+                return input(prompt)
+            except EOFError:
+                return None
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            return None
+        return line.rstrip("\n")
 
     def get_prompt(self):
         """Generates dynamic prompt string."""
         return f"{Colors.BOLD}AC-PRIME [Cycle:{self.cycle}]{Colors.ENDC} ~> "
 
     def run(self):
+        # Output is flushed explicitly (emit, type_effect, input prompt),
+        # so line buffering would only add a write per newline. The
+        # caller's setting is restored when the console exits.
+        stdout = sys.stdout
+        line_buffering = getattr(stdout, "line_buffering", None)
+        if line_buffering is not None and hasattr(stdout, "reconfigure"):
+            stdout.reconfigure(line_buffering=False)
+        try:
+            self._loop()
+        finally:
+            if line_buffering is not None and hasattr(stdout, "reconfigure"):
+                stdout.reconfigure(line_buffering=line_buffering)
+
+    def _loop(self):
         self.boot_sequence()
         
         while True:
             try:
                 # 1. Capture Input
-                raw = input(self.get_prompt())
+                raw = self.read_line(self.get_prompt())
 
-                if not raw.strip():
+                # Single scan of the line; long input is never
+                # lowercased just to rule out the exit keywords
+                stripped = raw.strip() if raw is not None else None
+                if stripped == "":
                     continue
 
-                if raw.strip().lower() in ("exit", "quit", "shutdown"):
+                # End of input shuts down like an explicit exit
+                if stripped is None or (
+                    len(stripped) <= self._EXIT_MAX_LEN
+                    and stripped.lower() in self._EXIT_COMMANDS
+                ):
                     self.type_effect("[SYSTEM] Syncing memory...", color=Colors.WARNING)
                     self.type_effect("[SYSTEM] Shutdown complete.", color=Colors.FAIL)
                     break
@@ -100,19 +160,15 @@ class ArcConsole:
                 
                 # 3. Input Gating
                 if not self.guardian.input_gate(cleaned):
-                    print(f"{Colors.CYAN}[GUARDIAN] ⛔ Request Denied (Gate Policy).{Colors.ENDC}")
+                    self.emit(f"{Colors.CYAN}[GUARDIAN] ⛔ Request Denied (Gate Policy).{Colors.ENDC}")
                     continue
 
-                # 4. Context/Cycle Switching (Meta-command)
-                if cleaned.startswith("cycle "):
-                    try:
-                        new_cycle = int(cleaned.split(" ")[1])
-                        self.cycle = new_cycle
-                        print(f"{Colors.GREEN}[SYSTEM] Context shifted to Cycle {self.cycle}{Colors.ENDC}")
-                        continue
-                    except ValueError:
-                        print(f"{Colors.FAIL}[ERROR] Invalid cycle format.{Colors.ENDC}")
-                        continue
+                # 4. Console meta-commands (e.g. Context/Cycle Switching)
+                verb, sep, args = cleaned.partition(" ")
+                handler = self._DISPATCH.get(verb) if sep else None
+                if handler is not None:
+                    handler(self, args)
+                    continue
 
                 # 5. Execution
                 # Note: You might need to update execute() to return (status, text) tuple
@@ -122,16 +178,33 @@ class ArcConsole:
                 # 6. Output Formatting
                 if result:
                     if "[Guardian]" in result:
-                        print(f"{Colors.CYAN}{result}{Colors.ENDC}")
+                        self.emit(f"{Colors.CYAN}{result}{Colors.ENDC}")
                     elif "Error" in result:
-                        print(f"{Colors.FAIL}{result}{Colors.ENDC}")
+                        self.emit(f"{Colors.FAIL}{result}{Colors.ENDC}")
                     else:
-                        print(f"{Colors.GREEN}{Colors.SIGIL_HIGH} {result}{Colors.ENDC}")
+                        self.emit(f"{Colors.GREEN}{Colors.SIGIL_HIGH} {result}{Colors.ENDC}")
 
             except KeyboardInterrupt:
-                print(f"\n{Colors.WARNING}[SYSTEM] Interrupt signal received.{Colors.ENDC}")
+                self.emit(f"\n{Colors.WARNING}[SYSTEM] Interrupt signal received.{Colors.ENDC}")
             except Exception as e:
-                print(f"{Colors.FAIL}[CRITICAL] Kernel Panic: {e}{Colors.ENDC}")
+                self.emit(f"{Colors.FAIL}[CRITICAL] Kernel Panic: {e}{Colors.ENDC}")
+
+    # ============================================================
+    # META-COMMANDS (handled by the console, not the interpreter)
+    # ============================================================
+    # Every handler takes (self, args) where args is the text after
+    # the verb.
+
+    def _cmd_cycle(self, args):
+        try:
+            self.cycle = int(args.partition(" ")[0])
+            self.emit(f"{Colors.GREEN}[SYSTEM] Context shifted to Cycle {self.cycle}{Colors.ENDC}")
+        except ValueError:
+            self.emit(f"{Colors.FAIL}[ERROR] Invalid cycle format.{Colors.ENDC}")
+
+    _DISPATCH = {
+        "cycle": _cmd_cycle,
+    }
 
 if __name__ == "__main__":
     console = ArcConsole()
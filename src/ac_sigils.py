@@ -3,6 +3,9 @@
 # ArcCore-Prime V1.4
 # ============================================================
 
+from typing import Iterable, List
+
+
 class SigilEngine:
     """
     Computes symbolic priority of memory nodes.
@@ -18,8 +21,23 @@ class SigilEngine:
         if not isinstance(text, str):
             return 0
 
+        weights = self.SIGIL_WEIGHTS
+
+        # CPython records whether a str is pure ASCII, so plain text
+        # can skip the scan, but only while every sigil is non-ASCII;
+        # the table is checked live since subclasses may override it
+        if text.isascii() and not any(sigil.isascii() for sigil in weights):
+            return 0
+
         score = 0
-        for sigil, weight in self.SIGIL_WEIGHTS.items():
+        for sigil, weight in weights.items():
             score += text.count(sigil) * weight
 
         return score
+
+    def evaluate_batch(self, texts: Iterable[str]) -> List[int]:
+        """
+        Scores several texts in one call (e.g. both nodes of an
+        interaction). Same result as evaluate() per text.
+        """
+        return [self.evaluate(t) for t in texts]
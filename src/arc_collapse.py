@@ -11,7 +11,6 @@
 #
 # ============================================================
 
-import copy
 import sys
 
 
@@ -70,24 +69,29 @@ class ACCollapseEngine:
         All Guardian policies are enforced at each step.
         """
 
-        # 1. Structural clone
-        collapsed = copy.deepcopy(node)
+        # 1. Read the fields collapse depends on. They are immutable
+        #    scalars/strings, and every field collapse rewrites is
+        #    reassigned below, so no deep clone is needed.
+        role = node.get("role", "unknown")
+        cycle = node.get("cycle", 0)
+        seed = node.get("seed")
+        raw = node.get("content", "")
+        priority = node.get("priority", 0)
 
         # 2. Guardian validation
-        ok, reason = self._validate_node(collapsed, depth)
+        ok, reason = self._validate_node(node, depth)
         if not ok:
             return {
-                "role": sys.intern(collapsed.get("role", "unknown")),
-                "cycle": collapsed.get("cycle", 0),
+                "role": sys.intern(role),
+                "cycle": cycle,
                 "error": sys.intern(f"[Guardian] Collapse blocked: {reason}"),
                 "seed": sys.intern("[Blocked]"),
                 "children": []
             }
 
         # 3. Priority-sensitive collapse
-        seed = collapsed.get("seed")
-        raw = collapsed.get("content", "")
-        priority = collapsed.get("priority", 0)
+        # Top-level copy keeps the caller's node untouched
+        collapsed = dict(node)
 
         # If seed already exists, discard raw content safely
         if seed:
@@ -100,17 +104,13 @@ class ACCollapseEngine:
             else:
                 snippet = raw[:50]
 
-            collapsed["seed"] = f"[AutoSeed AC-{collapsed.get('cycle', 0)}]: {snippet}..."
+            collapsed["seed"] = f"[AutoSeed AC-{cycle}]: {snippet}..."
             collapsed["content"] = None
 
         # 4. Recursively collapse children
-        child_list = collapsed.get("children", [])
-        new_children = []
-
-        for child in child_list:
-            new_child = self.collapse_state(child, depth + 1)
-            new_children.append(new_child)
-
-        collapsed["children"] = new_children
+        collapsed["children"] = [
+            self.collapse_state(child, depth + 1)
+            for child in node.get("children", [])
+        ]
 
         return collapsed
@@ -12,10 +12,74 @@
 # ============================================================
 
 import datetime
+import functools
 import hashlib
 import json
 import re
 import sys
+from dataclasses import dataclass
+from typing import FrozenSet, Iterator
+
+__all__ = ["ArcGuardian"]
+
+
+# Repeated punctuation collapses to a single mark; any other
+# match of the purify pattern is a redacted keyword
+_PUNCTUATION_COLLAPSE = {"??": "?", "!!": "!"}
+
+
+def _purify_replacement(match) -> str:
+    return _PUNCTUATION_COLLAPSE.get(match.group(0), "[redacted]")
+
+
+# Shared verdict for the structural gate's common (passing) path
+_OK = (True, "OK")
+
+
+@dataclass(frozen=True, slots=True)
+class _Policy:
+    """Structural gate limits, read as plain attributes on every gate call."""
+    allowed_roles: FrozenSet[str]
+    max_depth: int = 40
+    max_children_per_node: int = 20
+
+
+# One-shot encoder; same output as json.dumps(..., sort_keys=True)
+_encode_json = json.JSONEncoder(sort_keys=True).encode
+
+
+def _iter_tree_json(tree) -> Iterator[str]:
+    """
+    Yields json.dumps(tree, sort_keys=True) in pieces, one per
+    top-level child subtree, so the full serialization never has
+    to exist as a single string. Each piece is still produced by
+    the C encoder. Trees that are not a dict with string keys and
+    a children list are encoded in one piece.
+    """
+    children = tree.get("children") if isinstance(tree, dict) else None
+    if not isinstance(children, list) or not children or not all(
+        isinstance(k, str) for k in tree
+    ):
+        yield _encode_json(tree)
+        return
+
+    separator = "{"
+    for key in sorted(tree):
+        yield separator + _encode_json(key) + ": "
+        separator = ", "
+
+        if key != "children":
+            yield _encode_json(tree[key])
+            continue
+
+        child_separator = "["
+        for child in children:
+            yield child_separator
+            yield _encode_json(child)
+            child_separator = ", "
+        yield "]"
+
+    yield "}"
 
 
 class ArcGuardian:
@@ -30,6 +94,33 @@ class ArcGuardian:
     Arien is the Guardian.
     """
 
+    # Fixed governance vocabularies, allocated once at class load
+    _ALLOWED_INTENTS = frozenset({
+        "walk", "export", "inject", "sigil",
+        "guardian", "reconstruct", "thread",
+        "summary", "collapse"
+    })
+    _BLOCKED_COMMANDS = ("rm -rf", "shutdown", "system.exit", "drop database")
+    # Inputs shorter than this cannot contain any blocked command
+    _MIN_BLOCKED_LEN = min(map(len, _BLOCKED_COMMANDS))
+    _VALID_ROLES = frozenset({"user", "ai", "system"})
+
+    # Input-gate blocklist as one case-insensitive alternation, so the
+    # input is scanned once and never lowercased into a copy
+    _BLOCKED_RE = re.compile(
+        "|".join(map(re.escape, _BLOCKED_COMMANDS)), re.IGNORECASE
+    )
+
+    # Loop 1.4 — compiled redaction regex (deterministic, auditable).
+    # Punctuation normalization + redaction as one single-pass pattern
+    _REDACTED_TERMS = ("kill", "destroy", "corrupt")
+    _PURIFY_PATTERN = re.compile(
+        r"\?\?|!!|\b(" + "|".join(map(re.escape, _REDACTED_TERMS)) + r")\b"
+    )
+
+    # Inputs up to this length have their gate / purify result memoized
+    _GATE_CACHE_MAX_LEN = 256
+
     def __init__(self):
         self.guardian_name = sys.intern("Arien")
         self.boot_timestamp = datetime.datetime.now().isoformat()
@@ -41,29 +132,44 @@ class ArcGuardian:
             "•": 1,
         }
 
-        # Identity Integrity Key
+        # Identity Integrity Key — anchor bytes ("<name>:<boot ts>")
+        # are built once and kept for reuse
+        self._anchor_bytes = (
+            self.guardian_name.encode() + b":" + self.boot_timestamp.encode("ascii")
+        )
         self.identity_key = self._generate_identity_key()
 
-        # Loop 1.4 — compiled redaction regex (deterministic, auditable)
-        self._redacted_terms = ("kill", "destroy", "corrupt")
-        self._redaction_pattern = re.compile(
-            r"\b(" + "|".join(map(re.escape, self._redacted_terms)) + r")\b"
-        )
+        # Structural gate policy — single source of the limits
+        # enforced by gate_node / gate
+        self.policy = _Policy(allowed_roles=ArcGuardian._VALID_ROLES)
 
     # ============================================================
     # IDENTITY + HASHING SYSTEMS
     # ============================================================
 
     def _generate_identity_key(self):
-        anchor = f"{self.guardian_name}:{self.boot_timestamp}"
-        return hashlib.sha256(anchor.encode()).hexdigest()
+        return hashlib.sha256(self._anchor_bytes).hexdigest()
 
     def compute_kernel_hash(self, source_code: str) -> str:
         return hashlib.sha256(source_code.encode()).hexdigest()
 
+    def compute_kernel_hash_file(self, path: str) -> str:
+        """
+        Hashes a kernel source file straight from disk.
+        hashlib.file_digest keeps the read + digest loop in C.
+        """
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            return hashlib.sha256(f.read()).hexdigest()
+
     def compute_memory_tree_hash(self, tree_dict: dict) -> str:
-        serialized = json.dumps(tree_dict, sort_keys=True)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        # Streamed per subtree; digest is identical to hashing
+        # json.dumps(tree_dict, sort_keys=True) in one piece
+        hasher = hashlib.sha256()
+        for chunk in _iter_tree_json(tree_dict):
+            hasher.update(chunk.encode())
+        return hasher.hexdigest()
 
     def verify_integrity(self, stored_kernel: str, stored_memory: str):
         """
@@ -90,16 +196,24 @@ class ArcGuardian:
         Loop 1.4:
         - Uses compiled regex instead of chained replace
         - Deterministic and scalable
+        - One combined pattern, so the text is scanned once
+        - Short text is memoized; repeated commands skip the regex
         """
         if not isinstance(text, str):
             return ""
 
-        # Normalize repeated punctuation
-        text = re.sub(r"\?\?", "?", text)
-        text = re.sub(r"!!", "!", text)
+        # Same bound as input_gate, so long text is never kept alive
+        if len(text) <= self._GATE_CACHE_MAX_LEN:
+            return ArcGuardian._purify_cached(text)
+
+        return ArcGuardian._PURIFY_PATTERN.sub(_purify_replacement, text)
 
-        # Redact harmful keywords (exact-match, word-boundary)
-        return self._redaction_pattern.sub("[redacted]", text)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _purify_cached(text: str) -> str:
+        # Normalize repeated punctuation and redact harmful keywords
+        # (exact-match, word-boundary) in the same pass
+        return ArcGuardian._PURIFY_PATTERN.sub(_purify_replacement, text)
 
     # ============================================================
     # PATCH 1 — INPUT GATE (Front Gate)
@@ -112,17 +226,25 @@ class ArcGuardian:
         """
         if not isinstance(text, str):
             return False
-        if not text or len(text) > 2000:
-            return False
 
-        blocked = ("rm -rf", "shutdown", "system.exit", "drop database")
-        if any(b in text.lower() for b in blocked):
+        n = len(text)
+
+        # Short commands ("help", "walk", ...) skip the scan entirely
+        if n < self._MIN_BLOCKED_LEN:
+            return n > 0
+        if n > 2000:
             return False
 
-        return True
+        # Repeated short commands reuse their memoized verdict
+        if n <= self._GATE_CACHE_MAX_LEN:
+            return not ArcGuardian._is_blocked_cached(text)
 
-    # Backward-compatible alias
-    gate = input_gate
+        return not ArcGuardian._BLOCKED_RE.search(text)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_blocked_cached(text: str) -> bool:
+        return ArcGuardian._BLOCKED_RE.search(text) is not None
 
     # ============================================================
     # PATCH 2 — INTENT VALIDATION (Interpreter Gate)
@@ -134,12 +256,7 @@ class ArcGuardian:
         Governance note:
         - This is a whitelist, not inference.
         """
-        allowed = {
-            "walk", "export", "inject", "sigil",
-            "guardian", "reconstruct", "thread",
-            "summary", "collapse"
-        }
-        return cmd in allowed
+        return cmd in ArcGuardian._ALLOWED_INTENTS
 
     # ============================================================
     # STRUCTURAL GATE (Memory Tree Governance)
@@ -152,18 +269,29 @@ class ArcGuardian:
         - Guardian is sole authority
         - No policy inference happens outside this layer
         """
-        role = sys.intern(role)
-
-        if role not in ("user", "ai", "system"):
+        policy = self.policy
+        allowed_roles = policy.allowed_roles
+        max_depth = policy.max_depth
+        max_children = policy.max_children_per_node
+
+        # Hot path: a single combined check, shared verdict tuple.
+        # Integer compares run before the set lookup (hashes the role)
+        if depth <= max_depth and child_count <= max_children and role in allowed_roles:
+            return _OK
+
+        # Cold path: work out which rule failed, in the documented
+        # precedence (role first) so failure reasons stay stable
+        if role not in allowed_roles:
             return False, "Invalid role."
 
-        if depth > 40:
+        if depth > max_depth:
             return False, "Depth too deep — recursion risk."
 
-        if child_count > 20:
-            return False, "Too many children — structural overload."
+        return False, "Too many children — structural overload."
 
-        return True, "OK"
+    # Structural gate used by the memory kernel and collapse engine,
+    # called as gate(role, cycle, child_count, depth)
+    gate = gate_node
 
     # ============================================================
     # STATUS / REPORTING
@@ -10,12 +10,62 @@ from ac_sigils import SigilEngine
 from ac_collapse import ACCollapseEngine
 from arc_guardian import ArcGuardian
 
+import itertools
 import json
-import uuid
-import inspect
+import math
+import os
 import sys
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
+
+# Optional accelerator: orjson serializes in native code; stdlib json is
+# the fallback when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite(value) -> bool:
+    """
+    True if a JSON-shaped value holds NaN or +/-Infinity anywhere.
+    orjson writes those as null while json keeps them, so such trees
+    must be written by json to match their memory_hash.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
+# Node ids: 8 hex chars from a counter seeded at a random 32-bit offset.
+# Unique within a process; the random start keeps runs from sharing ids.
+_node_ids = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+# load_and_inject stops descending at this depth, so every indent it can
+# emit is built once here
+_INJECT_MAX_DEPTH = 50
+_INJECT_INDENTS = tuple("  " * i for i in range(_INJECT_MAX_DEPTH + 1))
+
+# Walk output markers (priority >= 3 is high) and upper-cased role labels
+_MARKER_HIGH = sys.intern("💠")
+_MARKER_LOW = sys.intern("•")
+_ROLE_LABELS = {r: sys.intern(r.upper()) for r in ("user", "ai", "system")}
+
+
+def _cycle_key(cycle) -> Optional[int]:
+    # Thread queries match on int(cycle), as the old full-tree scan did
+    try:
+        return int(cycle)
+    except (TypeError, ValueError):
+        return None
 
 
 # ============================================================
@@ -27,9 +77,17 @@ class HarmonicNode:
     A single memory packet in the fractal ArcCore tree.
     """
 
-    def __init__(self, role: str, content: str, cycle_id: int = 0):
-        self.id = str(uuid.uuid4())[:8]
-        self.timestamp = datetime.now().isoformat()
+    # Fixed attribute layout: no per-node __dict__
+    __slots__ = (
+        "id", "timestamp", "role", "raw_content", "structural_seed",
+        "cycle_alignment", "children", "is_collapsed", "priority",
+    )
+
+    def __init__(self, role: str, content: str, cycle_id: int = 0,
+                 timestamp: Optional[str] = None):
+        self.id = format(next(_node_ids) & 0xFFFFFFFF, "08x")
+        # Callers creating several nodes at once pass one shared stamp
+        self.timestamp = timestamp if timestamp is not None else datetime.now().isoformat()
 
         # Loop 1.4 — intern high-frequency structural strings
         self.role = sys.intern(role)
@@ -54,18 +112,20 @@ class HarmonicNode:
     # ------------------------------------------------------------
 
     def prune_to_seed(self):
+        content = self.raw_content
+
         if self.priority >= 3:
-            snippet = self.raw_content[:80]
-            self.structural_seed = f"[AC-{self.cycle_alignment}] {snippet}..."
+            # Only mark the seed as elided when content was actually cut
+            if len(content) > 80:
+                self.structural_seed = f"[AC-{self.cycle_alignment}] {content[:80]}..."
+            else:
+                self.structural_seed = f"[AC-{self.cycle_alignment}] {content}"
             self.is_collapsed = True
-            return
-
-        if len(self.raw_content) > 50:
-            snippet = self.raw_content[:30]
-            self.structural_seed = f"[Seed AC-{self.cycle_alignment}]: {snippet}..."
+        elif len(content) > 50:
+            self.structural_seed = f"[Seed AC-{self.cycle_alignment}]: {content[:30]}..."
             self.is_collapsed = True
         else:
-            self.structural_seed = self.raw_content
+            self.structural_seed = content
 
     # ------------------------------------------------------------
     #  REBUILD
@@ -81,16 +141,39 @@ class HarmonicNode:
     # ------------------------------------------------------------
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "role": self.role,
-            "cycle": self.cycle_alignment,
-            "content": self.raw_content,
-            "seed": self.structural_seed,
-            "collapsed": self.is_collapsed,
-            "priority": self.priority,
-            "children": [c.to_dict() for c in self.children]
-        }
+        # Pass 1: pre-order list of every node (parents before children).
+        # A node reached twice means a cyclic or shared child link; fail
+        # fast instead of growing the stack without bound.
+        order = []
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                raise ValueError(
+                    f"HarmonicNode {node.id} is linked more than once in the tree; "
+                    "cyclic or shared children cannot be serialized"
+                )
+            seen.add(id(node))
+            order.append(node)
+            stack.extend(node.children)
+
+        # Pass 2: build bottom-up, so each child dict exists before its parent
+        built = {}
+        for node in reversed(order):
+            kids = node.children
+            built[id(node)] = {
+                "id": node.id,
+                "role": node.role,
+                "cycle": node.cycle_alignment,
+                "content": node.raw_content,
+                "seed": node.structural_seed,
+                "collapsed": node.is_collapsed,
+                "priority": node.priority,
+                # Leaves (most AI nodes) skip the comprehension entirely
+                "children": [built[id(c)] for c in kids] if kids else []
+            }
+        return built[id(self)]
 
 
 # ============================================================
@@ -98,6 +181,17 @@ class HarmonicNode:
 # ============================================================
 
 class ArcMemorySystem:
+    """
+    Owns the HarmonicNode tree and its integrity stamps.
+
+    ingest_interaction re-hashes the whole tree after each new
+    pair, and recompact re-hashes it via mark_tree_edited, so
+    memory_hash always matches the tree at that point. Code that
+    edits nodes or root.children directly should call
+    mark_tree_edited() afterwards; save_memory stamps a hash of
+    the exact tree it writes either way.
+    """
+
     def __init__(self):
         self.root = HarmonicNode("system", "ArcCore-Prime Root Node", cycle_id=1)
 
@@ -106,9 +200,7 @@ class ArcMemorySystem:
         self.guardian = ArcGuardian()
 
         # Kernel integrity (unchanged — owned by Guardian loops)
-        import arc_prime
-        kernel_source = inspect.getsource(arc_prime)
-        self.kernel_hash = self.guardian.compute_kernel_hash(kernel_source)
+        self.kernel_hash = self.guardian.compute_kernel_hash_file(__file__)
 
         # Updated whenever memory changes
         self.memory_hash = None
@@ -121,11 +213,14 @@ class ArcMemorySystem:
         clean_user = self.guardian.purify(user_text)
         clean_ai = self.guardian.purify(ai_text)
 
-        user_node = HarmonicNode("user", clean_user, cycle_context)
-        ai_node   = HarmonicNode("ai",   clean_ai,   cycle_context)
+        ts = datetime.now().isoformat()
+        user_node = HarmonicNode("user", clean_user, cycle_context, timestamp=ts)
+        ai_node   = HarmonicNode("ai",   clean_ai,   cycle_context, timestamp=ts)
 
-        user_node.apply_sigil_priority(self.sigil)
-        ai_node.apply_sigil_priority(self.sigil)
+        # Score both nodes in one batched call
+        user_node.priority, ai_node.priority = self.sigil.evaluate_batch(
+            (user_node.raw_content, ai_node.raw_content)
+        )
 
         ok_u, msg_u = self.guardian.gate(user_node.role, user_node.cycle_alignment, 1, depth=1)
         ok_a, msg_a = self.guardian.gate(ai_node.role,   ai_node.cycle_alignment,   0, depth=2)
@@ -144,6 +239,55 @@ class ArcMemorySystem:
 
         self.memory_hash = self.guardian.compute_memory_tree_hash(self.root.to_dict())
 
+    def mark_tree_edited(self):
+        """
+        Call after editing nodes outside ingest_interaction / recompact
+        (content, seeds, children, root.children). Re-hashes the tree
+        so memory_hash reflects the edit.
+        """
+        self.memory_hash = self.guardian.compute_memory_tree_hash(self.root.to_dict())
+
+    # ------------------------------------------------------------
+    #  RECOMPACT (re-score + re-seed after a sigil change)
+    # ------------------------------------------------------------
+
+    def recompact(self, sigil_engine: Optional[SigilEngine] = None):
+        engine = sigil_engine if sigil_engine is not None else self.sigil
+
+        # Every ingested node, in tree order (the root is never seeded)
+        nodes = []
+        stack = list(reversed(self.root.children))
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+
+        priorities = engine.evaluate_batch([n.raw_content for n in nodes])
+        for node, priority in zip(nodes, priorities):
+            node.priority = priority
+            node.is_collapsed = False
+            node.prune_to_seed()
+
+        # Nodes changed in place, so the tree is re-hashed
+        self.mark_tree_edited()
+
+    def iter_cycle(self, cycle_id: int) -> Iterator[HarmonicNode]:
+        """
+        Nodes whose int(cycle) equals cycle_id, in tree order. Walks
+        the live node tree, so direct edits are always reflected;
+        callers serialize only the matches, not the whole tree.
+        """
+        seen = set()
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                raise ValueError(f"HarmonicNode {node.id} is linked more than once in the tree")
+            seen.add(id(node))
+            if _cycle_key(node.cycle_alignment) == cycle_id:
+                yield node
+            stack.extend(reversed(node.children))
+
     # ============================================================
     #  SAVE MEMORY (with integrity stamps)
     # ============================================================
@@ -151,6 +295,10 @@ class ArcMemorySystem:
     def save_memory(self, filename="arccore_memory.json"):
         tree = self.root.to_dict()
 
+        # The snapshot is serialized in full anyway; hash that same tree
+        # so the stamp can never lag behind an unreported edit
+        self.memory_hash = self.guardian.compute_memory_tree_hash(tree)
+
         integrity_block = {
             "kernel_hash": self.kernel_hash,
             "memory_hash": self.memory_hash,
@@ -164,8 +312,20 @@ class ArcMemorySystem:
             "tree": tree
         }
 
-        with open(filename, 'w') as f:
-            json.dump(payload, f, indent=2)
+        data = None
+        if orjson is not None and not _has_non_finite(payload):
+            try:
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            except (orjson.JSONEncodeError, TypeError):
+                # e.g. integers wider than 64 bits; json writes them fine
+                data = None
+
+        if data is not None:
+            with open(filename, 'wb') as f:
+                f.write(data)
+        else:
+            with open(filename, 'w') as f:
+                json.dump(payload, f, indent=2)
 
         print(f"[ArcCore] Memory + Integrity saved → {filename}")
 
@@ -174,8 +334,17 @@ class ArcMemorySystem:
     # ============================================================
 
     def load_and_inject(self, filename="arccore_memory.json"):
-        with open(filename, 'r') as f:
-            payload = json.load(f)
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                data = f.read()
+            try:
+                payload = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Stdlib-only extensions (NaN, Infinity, huge ints)
+                payload = json.loads(data)
+        else:
+            with open(filename, 'r') as f:
+                payload = json.load(f)
 
         integrity = payload.get("integrity", {})
         tree = payload.get("tree", {})
@@ -188,40 +357,54 @@ class ArcMemorySystem:
 
         buffer = [f"[Integrity: {status}]"]
 
-        max_depth = 50
+        max_depth = _INJECT_MAX_DEPTH
+        indents = _INJECT_INDENTS
         visited = set()
 
-        MARKER_HIGH = sys.intern("💠")
-        MARKER_LOW  = sys.intern("•")
-
-        def walk(node, depth=0):
-            indent = "  " * depth
+        # Explicit-stack DFS: deep histories cannot hit the recursion limit.
+        # Children are pushed reversed so they pop in their stored order.
+        stack = [(tree, 0)]
+        while stack:
+            node, depth = stack.pop()
+            indent = indents[depth]
             node_id = node.get("id")
             node_key = node_id if node_id is not None else id(node)
 
             if node_key in visited:
                 warning = f"Cycle detected at node {node_key}; skipping children"
                 buffer.append(f"{indent}[{warning}]")
-                return
+                continue
 
             visited.add(node_key)
 
-            seed = node.get("seed") or node.get("content")
-            cycle = node.get("cycle")
-            role = sys.intern(node.get("role", "").upper())
-            priority = node.get("priority", 0)
-
-            marker = MARKER_HIGH if priority >= 3 else MARKER_LOW
-            buffer.append(f"{indent}{marker} [AC-{cycle}] {role}: {seed}")
+            # Files written by save_memory carry every key (see to_dict), so
+            # index directly; fall back to defaults for hand-edited trees
+            try:
+                seed = node["seed"] or node["content"]
+                cycle = node["cycle"]
+                role = node["role"]
+                priority = node["priority"]
+            except KeyError:
+                seed = node.get("seed") or node.get("content")
+                cycle = node.get("cycle")
+                role = node.get("role", "")
+                priority = node.get("priority", 0)
+            label = _ROLE_LABELS.get(role)
+            if label is None:
+                label = sys.intern(role.upper())
+
+            marker = _MARKER_HIGH if priority >= 3 else _MARKER_LOW
+            buffer.append(f"{indent}{marker} [AC-{cycle}] {label}: {seed}")
 
             if depth >= max_depth:
                 buffer.append(f"{indent}[Traversal halted: depth limit {max_depth} reached]")
-                return
+                continue
 
-            for child in node.get("children", []):
-                walk(child, depth + 1)
+            children = node.get("children", [])
+            if children:
+                child_depth = depth + 1
+                stack.extend((child, child_depth) for child in reversed(children))
 
-        walk(tree)
         return "\n".join(buffer)
 
 
@@ -0,0 +1,124 @@
+
+# ============================================================
+# ARC CORE — COLLAPSE ENGINE TEST
+# Loop 2.2 — Collapse Result Integrity
+# ============================================================
+
+import copy
+import json
+
+from ac_collapse import ACCollapseEngine, CompressionLevel
+from arc_guardian import ArcGuardian
+
+
+def sample_tree():
+    return {
+        "role": "system",
+        "cycle": 1,
+        "content": "ArcCore root " * 10,
+        "children": [
+            {"role": "user", "cycle": 3, "content": "u" * 90, "priority": 3,
+             "seed": None, "children": []},
+            {"role": "ai", "cycle": 3, "content": "short", "seed": "[AC-3] kept",
+             "compression_level": CompressionLevel.SUMMARY, "children": []},
+            {"role": "rogue", "cycle": 4, "content": "x", "children": []},
+            {"role": "rogue", "cycle": 4, "content": "y", "children": []},
+        ],
+    }
+
+
+def run_test():
+    print("\n=== ArcCore Collapse Test (Loop 2.2) ===\n")
+
+    engine = ACCollapseEngine(guardian=ArcGuardian())
+
+    # ------------------------------------------------------------
+    # 1. Result round-trips through JSON
+    # ------------------------------------------------------------
+
+    result = engine.collapse_state(sample_tree())
+    encoded = json.dumps(result, sort_keys=True)
+    assert json.loads(encoded) == result
+    assert all(isinstance(c["children"], list) for c in result["children"])
+    print("[OK] Collapse result serializes with json.dumps.")
+
+    # ------------------------------------------------------------
+    # 2. Result can be hashed, copied, re-collapsed and extended
+    # ------------------------------------------------------------
+
+    guardian = ArcGuardian()
+    assert guardian.compute_memory_tree_hash(result)
+
+    duplicate = copy.deepcopy(result)
+    assert duplicate == result
+
+    # Seeded nodes are stable under a second collapse
+    again = engine.collapse_state_inplace(duplicate)
+    assert again["seed"] == result["seed"]
+    assert again["children"][:2] == result["children"][:2]
+
+    result["children"][0]["children"].append({"role": "ai", "cycle": 3})
+    print("[OK] Result hashes, deep-copies, re-collapses and accepts children.")
+
+    # ------------------------------------------------------------
+    # 3. Identical leaves stay separate nodes (the result is a tree)
+    # ------------------------------------------------------------
+
+    blocked = engine.collapse_state(sample_tree())["children"][2:]
+    assert blocked[0]["seed"] == "[Blocked]"
+    assert blocked[0] == blocked[1] and blocked[0] is not blocked[1]
+
+    twins = {"role": "system", "cycle": 1, "seed": "[AC-1] root", "children": [
+        {"role": "ai", "cycle": 2, "content": "same"},
+        {"role": "ai", "cycle": 2, "content": "same"},
+    ]}
+    first, second = engine.collapse_state(twins)["children"]
+    first["children"].append({"role": "ai", "cycle": 2})
+    assert second["children"] == []
+
+    originals = list(twins["children"])
+    engine.collapse_state_inplace(twins)
+    assert all(a is b for a, b in zip(twins["children"], originals))
+    print("[OK] Identical leaves are not aliased.")
+
+    # ------------------------------------------------------------
+    # 4. The caller's tree is never shared with the result
+    # ------------------------------------------------------------
+
+    source = {
+        "role": "system", "cycle": 1, "seed": "[AC-1] root", "children": [
+            {"role": "ai", "cycle": 1, "content": "", "seed": "[AC-1] leaf",
+             "compression_level": CompressionLevel.SEED, "children": []},
+        ],
+    }
+    snapshot = copy.deepcopy(source)
+
+    result = engine.collapse_state(source)
+    leaf = result["children"][0]
+    assert leaf["content"] is None
+    assert leaf["compressed_from"] is None
+
+    leaf["seed"] = "edited"
+    leaf["children"].append({"role": "ai", "cycle": 1})
+    assert source == snapshot
+    print("[OK] Settled leaves are cloned; the input tree is untouched.")
+
+    # ------------------------------------------------------------
+    # 5. In-place collapse matches collapse_state on the same tree
+    # ------------------------------------------------------------
+
+    expected = engine.collapse_state(sample_tree())
+    tree = sample_tree()
+    user_node = tree["children"][0]
+    result = engine.collapse_state_inplace(tree)
+    assert result is tree
+    assert result == expected
+    assert result["children"][0] is user_node
+    assert user_node["content"] is None
+    print("[OK] collapse_state_inplace reuses the tree and matches collapse_state.")
+
+    print("\n=== Collapse Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,52 @@
+
+# ============================================================
+# ARC CORE — ECHO TEST
+# Bounded echo log, reflection and export
+# ============================================================
+
+from ac_echo import ArcEcho
+
+
+def run_test():
+    print("\n=== ArcCore Echo Test ===\n")
+
+    # ------------------------------------------------------------
+    # 1. The log is bounded; oldest echoes are evicted first
+    # ------------------------------------------------------------
+
+    echo = ArcEcho(max_echoes=3)
+    for i in range(5):
+        echo.pulse(f"signal {i}", intensity=i)
+
+    assert [e["signal"] for e in echo.echo_log] == ["signal 2", "signal 3", "signal 4"]
+    assert ArcEcho().echo_log.maxlen == ArcEcho.MAX_ECHOES
+    print("[OK] ArcEcho(max_echoes) bounds the log.")
+
+    # ------------------------------------------------------------
+    # 2. reflect keeps list-slice semantics
+    # ------------------------------------------------------------
+
+    signals = [e["signal"] for e in echo.echo_log]
+    for count in (-5, -1, 0, 1, 2, 3, 10):
+        assert [e["signal"] for e in echo.reflect(count)] == signals[-count:]
+    print("[OK] reflect matches list-slice semantics.")
+
+    # ------------------------------------------------------------
+    # 3. Export formats timestamps; ids are 12 hex chars
+    # ------------------------------------------------------------
+
+    exported = echo.export()
+    assert exported["echo_count"] == 3
+    assert all(e["timestamp"].endswith("+00:00") for e in exported["echoes"])
+    assert all(len(e["id"]) == 12 for e in exported["echoes"])
+    assert all(isinstance(e["timestamp"], int) for e in echo.echo_log)
+
+    echo.clear()
+    assert echo.reflect() == []
+    print("[OK] export, ids and clear behave as expected.")
+
+    print("\n=== Echo Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
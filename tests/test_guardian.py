@@ -0,0 +1,60 @@
+
+# ============================================================
+# ARC CORE — GUARDIAN TEST
+# Kernel hashing and gate policy
+# ============================================================
+
+import os
+import tempfile
+
+from arc_guardian import ArcGuardian
+
+
+def run_test():
+    print("\n=== ArcCore Guardian Test ===\n")
+
+    guardian = ArcGuardian()
+
+    # ------------------------------------------------------------
+    # 1. File hashing matches hashing the decoded source
+    # ------------------------------------------------------------
+
+    source = "# kernel\nprint('ArcCore — Arien 💠')\n" * 500
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "kernel.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+        assert guardian.compute_kernel_hash_file(path) == guardian.compute_kernel_hash(source)
+
+        empty = os.path.join(tmp, "empty.py")
+        open(empty, "w").close()
+        assert guardian.compute_kernel_hash_file(empty) == guardian.compute_kernel_hash("")
+    print("[OK] compute_kernel_hash_file matches compute_kernel_hash.")
+
+    # ------------------------------------------------------------
+    # 2. Gate policy limits
+    # ------------------------------------------------------------
+
+    assert guardian.gate("user", 1, 0, depth=1) == (True, "OK")
+    assert not guardian.gate("rogue", 1, 0, depth=1)[0]
+    assert not guardian.gate("ai", 1, 0, depth=guardian.policy.max_depth + 1)[0]
+    assert not guardian.gate("ai", 1, guardian.policy.max_children_per_node + 1, depth=1)[0]
+    print("[OK] Gate enforces role, depth and child limits.")
+
+    # ------------------------------------------------------------
+    # 3. purify memoizes short text only
+    # ------------------------------------------------------------
+
+    assert guardian.purify("kill it!!") == "[redacted] it!"
+    long_text = "destroy?? " + "x" * ArcGuardian._GATE_CACHE_MAX_LEN
+    cached = ArcGuardian._purify_cached.cache_info().currsize
+    assert guardian.purify(long_text) == "[redacted]? " + "x" * ArcGuardian._GATE_CACHE_MAX_LEN
+    assert ArcGuardian._purify_cached.cache_info().currsize == cached
+    assert guardian.purify(None) == ""
+    print("[OK] purify caches short text and handles long text uncached.")
+
+    print("\n=== Guardian Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,191 @@
+
+# ============================================================
+# ARC CORE — MEMORY KERNEL TEST
+# Integrity stamps, cycle threads and recompaction
+# ============================================================
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+from types import SimpleNamespace
+
+from ac_interpreter import cmd_reconstruct_thread
+from ac_reconstruct import ArcReconstruct
+from ac_sigils import SigilEngine
+from arc_prime import ArcMemorySystem, HarmonicNode
+
+
+def full_hash(tree: dict) -> str:
+    # Reference definition of the memory hash
+    return hashlib.sha256(json.dumps(tree, sort_keys=True).encode()).hexdigest()
+
+
+def seeded_memory() -> ArcMemorySystem:
+    mem = ArcMemorySystem()
+    mem.ingest_interaction("Cycle 3 insight: 💠 structured descent.", "Cycle 3 grounds.", cycle_context=3)
+    mem.ingest_interaction("Cycle 7 note: " + "recursive clarity " * 5, "Cycle 7 threads ✨", cycle_context=7)
+    mem.ingest_interaction("Cycle 3 elaboration.", "Yes — Cycle 3 forms a pattern.", cycle_context=3)
+    mem.ingest_interaction("String cycle id.", "Tagged as text.", cycle_context="3")
+    return mem
+
+
+def scanned_thread(mem: ArcMemorySystem, cycle_id: int) -> str:
+    # Reference full-tree thread scan
+    lines = ArcReconstruct().reconstruct_thread(mem.root.to_dict(), cycle_id)
+    return "\n".join(lines) if lines else "[thread] No entries found."
+
+
+class FlatSigils(SigilEngine):
+    # Every sigil counts as high priority
+    SIGIL_WEIGHTS = {"💠": 3, "✨": 3, "•": 3}
+
+
+def run_test():
+    print("\n=== ArcCore Memory Kernel Test ===\n")
+
+    # ------------------------------------------------------------
+    # 1. Every ingest stamps the full memory hash
+    # ------------------------------------------------------------
+
+    mem = ArcMemorySystem()
+    for i in range(12):
+        mem.ingest_interaction(f"user {i} 💠" * (i % 3), f"ai {i}" * (i % 20), cycle_context=i % 4)
+        tree = mem.root.to_dict()
+        assert mem.memory_hash == full_hash(tree)
+        assert mem.memory_hash == mem.guardian.compute_memory_tree_hash(tree)
+
+    # A direct swap followed by an ingest is still hashed correctly
+    mem.root.children[0] = HarmonicNode("user", "swapped in", 1)
+    mem.ingest_interaction("after swap", "re-hashed", cycle_context=1)
+    assert mem.memory_hash == full_hash(mem.root.to_dict())
+    print("[OK] ingest_interaction stamps the full-tree hash.")
+
+    # ------------------------------------------------------------
+    # 2. Direct edits are picked up through mark_tree_edited
+    # ------------------------------------------------------------
+
+    mem.root.children[0].raw_content = "edited in place"
+    mem.root.children[1] = HarmonicNode("user", "replacement", 1)
+    mem.mark_tree_edited()
+    assert mem.memory_hash == full_hash(mem.root.to_dict())
+
+    mem.ingest_interaction("after edit", "still tracked", cycle_context=2)
+    assert mem.memory_hash == full_hash(mem.root.to_dict())
+    print("[OK] mark_tree_edited resynchronizes the memory hash.")
+
+    # ------------------------------------------------------------
+    # 3. save_memory stamps the hash of the tree it writes
+    # ------------------------------------------------------------
+
+    mem.root.children[0].raw_content = "unreported edit"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "memory.json")
+        mem.save_memory(path)
+        with open(path, "rb") as f:
+            payload = json.loads(f.read())
+        assert payload["integrity"]["memory_hash"] == full_hash(payload["tree"])
+        assert mem.load_and_inject(path).startswith("[Integrity: OK]")
+    print("[OK] Snapshot stamp matches the saved tree.")
+
+    # Values orjson cannot write faithfully fall back to stdlib json
+    for odd_cycle in (2 ** 70, float("nan")):
+        mem = ArcMemorySystem()
+        mem.ingest_interaction("odd cycle", "still saved", cycle_context=odd_cycle)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "memory.json")
+            mem.save_memory(path)
+            with open(path, "rb") as f:
+                payload = json.loads(f.read())
+            saved_cycle = payload["tree"]["children"][0]["cycle"]
+            assert saved_cycle == odd_cycle or math.isnan(saved_cycle)
+            assert payload["integrity"]["memory_hash"] == full_hash(payload["tree"])
+            assert payload["integrity"]["memory_hash"] == mem.memory_hash
+    print("[OK] Huge-int and NaN cycles save with a matching stamp.")
+
+    # ------------------------------------------------------------
+    # 4. Cyclic child links fail fast in to_dict
+    # ------------------------------------------------------------
+
+    parent = HarmonicNode("user", "parent", 1)
+    child = HarmonicNode("ai", "child", 1)
+    parent.children.append(child)
+    child.children.append(parent)
+    try:
+        parent.to_dict()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cyclic tree serialized")
+
+    deep = HarmonicNode("user", "deep", 1)
+    tip = deep
+    for _ in range(5000):
+        tip.children.append(HarmonicNode("ai", "link", 1))
+        tip = tip.children[0]
+    assert deep.to_dict()["children"][0]["content"] == "link"
+    print("[OK] to_dict rejects cycles and handles deep chains.")
+
+    # ------------------------------------------------------------
+    # 5. iter_cycle matches the full-tree thread scan
+    # ------------------------------------------------------------
+
+    mem = seeded_memory()
+    shell = SimpleNamespace(memory=mem, reconstruct=ArcReconstruct())
+
+    assert [n.role for n in mem.iter_cycle(7)] == ["user", "ai"]
+    assert len(list(mem.iter_cycle(3))) == 6
+    for cycle_id in (1, 3, 7, 9):
+        assert cmd_reconstruct_thread(shell, str(cycle_id)) == scanned_thread(mem, cycle_id)
+
+    # Direct edits show up without any resync call
+    mem.root.children.append(HarmonicNode("user", "added directly", 9))
+    assert [n.raw_content for n in mem.iter_cycle(9)] == ["added directly"]
+
+    mem.root.children[0] = HarmonicNode("user", "swapped in", 1)
+    mem.ingest_interaction("Cycle 5 arrives.", "Noted.", cycle_context=5)
+    assert len(list(mem.iter_cycle(3))) == 4
+    assert [n.role for n in mem.iter_cycle(5)] == ["user", "ai"]
+    for cycle_id in (1, 3, 5, 9):
+        assert cmd_reconstruct_thread(shell, str(cycle_id)) == scanned_thread(mem, cycle_id)
+
+    looped = HarmonicNode("user", "loop", 2)
+    looped.children.append(looped)
+    mem.root.children.append(looped)
+    try:
+        list(mem.iter_cycle(2))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cyclic tree walked")
+    print("[OK] iter_cycle matches the full-tree thread scan.")
+
+    # ------------------------------------------------------------
+    # 6. recompact re-scores, re-seeds and re-stamps the tree
+    # ------------------------------------------------------------
+
+    mem = seeded_memory()
+    before = mem.root.to_dict()
+    before_hash = mem.memory_hash
+
+    mem.recompact()
+    assert mem.root.to_dict() == before
+    assert mem.memory_hash == before_hash
+
+    mem.recompact(FlatSigils())
+    reply = mem.root.children[1].children[0]
+    assert reply.priority == 3 and reply.is_collapsed
+    assert reply.structural_seed == f"[AC-7] {reply.raw_content}"
+    assert mem.memory_hash == full_hash(mem.root.to_dict()) != before_hash
+
+    mem.recompact()
+    assert mem.root.to_dict() == before
+    assert mem.memory_hash == before_hash
+    print("[OK] recompact follows sigil weights and keeps the hash current.")
+
+    print("\n=== Memory Kernel Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
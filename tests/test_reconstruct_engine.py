@@ -0,0 +1,57 @@
+
+# ============================================================
+# ARC CORE — RECONSTRUCTION ENGINE BASELINE TEST
+# Loop 2.2 — Output must match the original recursive engine
+# ============================================================
+
+from ac_reconstruct import ArcReconstruct
+
+
+TREE = {"role": "system", "cycle": 1, "content": "Root", "children": [
+    {"role": "user", "cycle": 3, "seed": "[AC-3] descent", "compression_level": 2, "children": [
+        {"role": "ai", "cycle": 3, "content": "Grounding reply", "compression_level": 1, "children": []},
+        {"role": "ai", "cycle": 3, "seed": "💠", "compression_level": 3, "children": []},
+    ]},
+    {"role": "user", "cycle": 7, "content": "Raw note", "compression_level": 0, "children": [
+        {"role": "ai", "cycle": 3, "seed": "Seed AC-3: oddly shaped", "children": []},
+    ]},
+]}
+
+# Captured from the original recursive ArcReconstruct on TREE
+EXPECTED_FULL = [
+    "[AC-1] SYSTEM: (expanded) Root",
+    "  [AC-3] USER: (AC-3) → descent",
+    "  [AC-7] USER: (expanded) Raw note",
+    "    [AC-3] AI: (expanded) Seed AC-3: oddly shaped",
+]
+EXPECTED_THREAD_3 = [
+    "[AC-3] USER: (AC-3) → descent",
+    "[AC-3] AI: (expanded) Grounding reply",
+    "[AC-3] AI: [Sigil Anchor — reconstruction required]",
+    "[AC-3] AI: (expanded) Seed AC-3: oddly shaped",
+]
+
+
+def run_test():
+    print("\n=== ArcCore Reconstruction Baseline Test ===\n")
+
+    engine = ArcReconstruct()
+
+    assert engine.reconstruct_full(TREE) == "\n".join(EXPECTED_FULL)
+    assert engine.reconstruct_node(TREE, 0) == EXPECTED_FULL
+    print("[OK] Full and node reconstruction match the baseline.")
+
+    assert engine.reconstruct_thread(TREE, 3) == EXPECTED_THREAD_3
+    assert engine.reconstruct_thread(TREE, 9) == []
+    print("[OK] Thread reconstruction matches the baseline.")
+
+    # Pooled stacks and shared output lists must not leak between calls
+    assert engine.reconstruct_full(TREE) == "\n".join(EXPECTED_FULL)
+    assert engine.reconstruct_thread(TREE, 3) == EXPECTED_THREAD_3
+    print("[OK] Repeated calls are independent.")
+
+    print("\n=== Reconstruction Baseline Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
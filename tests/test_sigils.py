@@ -0,0 +1,41 @@
+
+# ============================================================
+# ARC CORE — SIGIL ENGINE TEST
+# Prismatic weighting, single and batched
+# ============================================================
+
+from ac_sigils import SigilEngine
+
+
+class AsciiSigils(SigilEngine):
+    SIGIL_WEIGHTS = {"*": 3, "💠": 1}
+
+
+def run_test():
+    print("\n=== ArcCore Sigil Engine Test ===\n")
+
+    engine = SigilEngine()
+
+    assert engine.evaluate("plain ascii") == 0
+    assert engine.evaluate("💠💠 ✨ •") == 9
+    assert engine.evaluate(None) == 0
+    print("[OK] evaluate scores sigils by weight.")
+
+    texts = ["", "plain", "💠 Hello", "✨•", "ñ", None, 42]
+    assert engine.evaluate_batch(texts) == [engine.evaluate(t) for t in texts]
+    assert engine.evaluate_batch(t for t in ("💠", "•")) == [3, 1]
+    assert engine.evaluate_batch([]) == []
+    print("[OK] evaluate_batch matches evaluate per text.")
+
+    ascii_engine = AsciiSigils()
+    assert ascii_engine.evaluate("***") == 9
+    assert ascii_engine.evaluate("plain") == 0
+    assert ascii_engine.evaluate("* 💠") == 4
+    assert ascii_engine.evaluate_batch(["***", "x"]) == [9, 0]
+    print("[OK] ASCII sigils in an overridden table are scored.")
+
+    print("\n=== Sigil Engine Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()